@@ -2,37 +2,246 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import serial
+import sys
+import threading
 import time
+from collections import deque
+from types import SimpleNamespace
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mean_xy(pts, idx, w, h):
+        sx = 0.0
+        sy = 0.0
+        for i in idx:
+            sx += pts[i, 0]
+            sy += pts[i, 1]
+        n = idx.shape[0]
+        return int(sx / n * w), int(sy / n * h)
+    
+    @njit(cache=True, fastmath=True)
+    def _gaze_kernel(pts, left_eye_idx, right_eye_idx, left_iris_idx, right_iris_idx,
+                     w, h, hthr, vthr):
+        """Eye and iris pixel centers plus the looking-at-screen decision in one call"""
+        lex, ley = _mean_xy(pts, left_eye_idx, w, h)
+        rex, rey = _mean_xy(pts, right_eye_idx, w, h)
+        lix, liy = _mean_xy(pts, left_iris_idx, w, h)
+        rix, riy = _mean_xy(pts, right_iris_idx, w, h)
+        looking = (abs(lix - lex) < hthr and abs(liy - ley) < vthr and
+                   abs(rix - rex) < hthr and abs(riy - rey) < vthr)
+        return lex, ley, rex, rey, lix, liy, rix, riy, looking
+else:
+    _gaze_kernel = None
+
+class TaskFaceMesh:
+    """FaceMesh-compatible wrapper around the MediaPipe Tasks FaceLandmarker,
+    for running a custom model bundle (e.g. INT8-quantized) or the GPU delegate"""
+    def __init__(self, model_path, use_gpu=False, min_detection_confidence=0.4,
+                 min_tracking_confidence=0.4):
+        vision = mp.tasks.vision
+        delegate = mp.tasks.BaseOptions.Delegate
+        options = vision.FaceLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(
+                model_asset_path=model_path,
+                delegate=delegate.GPU if use_gpu else delegate.CPU
+            ),
+            running_mode=vision.RunningMode.VIDEO,
+            num_faces=1,
+            min_face_detection_confidence=min_detection_confidence,
+            min_face_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self.landmarker = vision.FaceLandmarker.create_from_options(options)
+        self.timestamp_ms = 0
+    
+    def process(self, rgb_frame):
+        """Run the landmarker and return results shaped like FaceMesh.process"""
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        # VIDEO mode needs strictly increasing timestamps
+        self.timestamp_ms = max(self.timestamp_ms + 1, int(time.monotonic() * 1000))
+        result = self.landmarker.detect_for_video(image, self.timestamp_ms)
+        faces = [SimpleNamespace(landmark=lms) for lms in result.face_landmarks]
+        return SimpleNamespace(multi_face_landmarks=faces or None)
+    
+    def close(self):
+        self.landmarker.close()
+
+class FrameGrabber:
+    """Reads frames on a background thread and keeps only the most recent one,
+    so slow processing never works on stale buffered frames"""
+    def __init__(self, cap):
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.new_frame = threading.Event()
+        self.latest = None
+        self.ok = True
+        self.running = False
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+    
+    def start(self):
+        self.running = True
+        self.thread.start()
+        return self
+    
+    def _loop(self):
+        while self.running:
+            ret, frame = self.cap.read()
+            with self.lock:
+                if not ret:
+                    self.ok = False
+                    self.new_frame.set()
+                    break
+                self.latest = frame
+                self.new_frame.set()
+    
+    def get_latest(self):
+        """Wait for a frame newer than the last one returned, None once the
+        camera read has failed"""
+        # Slow reads are waited out; only a stopped reader thread ends the wait
+        while not self.new_frame.wait(0.5):
+            if not self.thread.is_alive():
+                return None
+        with self.lock:
+            self.new_frame.clear()
+            return self.latest if self.ok else None
+    
+    def stop(self, timeout=1.0):
+        """Stop the reader thread. Returns False if it is still stuck in a read,
+        in which case the capture must not be released"""
+        self.running = False
+        if self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+        return not self.thread.is_alive()
 
 class EyeTracker:
-    def __init__(self, arduino_port='COM3', use_arduino=True):
+    # Fixed attribute layout for faster per-frame attribute access
+    __slots__ = (
+        'mp_face_mesh', 'face_mesh', 'mp_drawing', 'high_precision',
+        '_rgb_buf', 'inference_size', '_small_buf', 'full_res_hold', '_full_res_frames',
+        'LEFT_EYE', 'RIGHT_EYE', 'LEFT_IRIS', 'RIGHT_IRIS',
+        '_LEFT_EYE_IDX', '_RIGHT_EYE_IDX', '_LEFT_IRIS_IDX', '_RIGHT_IRIS_IDX',
+        'looking_at_screen', '_hthr', '_vthr', '_gaze_thr',
+        'ear_baseline', 'blink_ratio', 'max_blink_ns', '_blink_start',
+        'frame_skip', 'last_centers', 'last_status', 'last_color', 'draw', '_font',
+        'use_arduino', 'arduino', 'arduino_reader', '_trigger_pkt', 'arduino_responses',
+        'look_away_start_time', '_look_away_threshold', '_threshold_ns', 'signal_sent',
+    )
+    
+    def __init__(self, arduino_port='COM3', use_arduino=True, use_gpu=False,
+                 model_path=None, draw=True,
+                 inference_size=None, high_precision=True, frame_skip=2):
+        if frame_skip < 1:
+            raise ValueError(f"frame_skip must be at least 1, got {frame_skip}")
+
         # Initialize MediaPipe Face Mesh
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.4,
-            min_tracking_confidence=0.4
-        )
+        self.face_mesh = None
+        if use_gpu or model_path:
+            model_path = model_path or 'face_landmarker.task'
+            device = "GPU" if use_gpu else "CPU"
+            try:
+                self.face_mesh = TaskFaceMesh(model_path, use_gpu=use_gpu)
+                print(f"Using {device} face landmarker from {model_path}")
+            except Exception as e:
+                print(f"Warning: Could not start {device} face landmarker: {e}")
+                print("Falling back to CPU FaceMesh...")
+        # high_precision=False skips FaceMesh's iris refinement model and
+        # estimates the iris from the eye region of the frame instead. The task
+        # landmarker always runs its iris model, so its iris landmarks are used.
+        if not high_precision and self.face_mesh is not None:
+            print("Warning: high_precision=False has no effect with the face "
+                  "landmarker, using its iris landmarks")
+            high_precision = True
+        self.high_precision = high_precision
+        if self.face_mesh is None:
+            self.face_mesh = self.mp_face_mesh.FaceMesh(
+                max_num_faces=1,
+                refine_landmarks=high_precision,
+                min_detection_confidence=0.4,
+                min_tracking_confidence=0.4
+            )
         self.mp_drawing = mp.solutions.drawing_utils
         
+        # Reused RGB buffer for FaceMesh input, resized if the camera frame size changes
+        self._rgb_buf = np.empty((480, 640, 3), dtype=np.uint8)
+        
+        # Optionally run FaceMesh on a downscaled (width, height) copy of the frame,
+        # e.g. (320, 240). Landmarks are normalized so they map back onto the full
+        # frame, but iris landmarks lose precision against the pixel thresholds,
+        # so this is off by default. If no face is found at low resolution the
+        # same frame is retried at full resolution, which is then kept for the
+        # next full_res_hold inference frames.
+        self.inference_size = inference_size
+        self._small_buf = None
+        if inference_size is not None:
+            self._small_buf = np.empty((inference_size[1], inference_size[0], 3),
+                                       dtype=np.uint8)
+        self.full_res_hold = 30
+        self._full_res_frames = 0
+        
         # Eye landmark indices for MediaPipe Face Mesh
         self.LEFT_EYE = [362, 385, 387, 263, 373, 380]
         self.RIGHT_EYE = [33, 160, 158, 133, 153, 144]
         self.LEFT_IRIS = [474, 475, 476, 477]
         self.RIGHT_IRIS = [469, 470, 471, 472]
         
+        # Index arrays for gathering landmark coordinates with NumPy
+        self._LEFT_EYE_IDX = np.asarray(self.LEFT_EYE, dtype=np.intp)
+        self._RIGHT_EYE_IDX = np.asarray(self.RIGHT_EYE, dtype=np.intp)
+        self._LEFT_IRIS_IDX = np.asarray(self.LEFT_IRIS, dtype=np.intp)
+        self._RIGHT_IRIS_IDX = np.asarray(self.RIGHT_IRIS, dtype=np.intp)
+        
         # Define screen attention zone
         self.looking_at_screen = False
         
+        # Thresholds for "looking at screen", in pixels of iris offset
+        self._hthr = 4
+        self._vthr = 2
+        self._update_gaze_thr()
+        
+        # Blink detection: a blink is an eye aspect ratio well below the
+        # running open-eye average that lasts no longer than max_blink_ns.
+        # Longer runs (squinting, looking down) go through the gaze check.
+        self.ear_baseline = None
+        self.blink_ratio = 0.75
+        self.max_blink_ns = 400_000_000
+        self._blink_start = None
+        
+        # Only run inference on every frame_skip-th frame, reusing the last
+        # annotations in between
+        self.frame_skip = frame_skip
+        self.last_centers = None
+        self.last_status = ""
+        self.last_color = (0, 0, 255)
+        
+        # Set draw=False when frames are not displayed to skip all annotation
+        self.draw = draw
+        self._font = cv2.FONT_HERSHEY_SIMPLEX
+        
         # Arduino integration
         self.use_arduino = use_arduino
         self.arduino = None
+        self.arduino_reader = None
+        # Any non-newline byte fires the servo, so the trigger is a single byte
+        self._trigger_pkt = b'1'
+        self.arduino_responses = deque(maxlen=10)
         if self.use_arduino:
             try:
-                self.arduino = serial.Serial(arduino_port, 9600)
+                # Short read timeout lets the reader thread notice shutdown,
+                # zero write timeout keeps writes from blocking process_frame
+                self.arduino = serial.Serial(arduino_port, 9600,
+                                             timeout=0.1, write_timeout=0)
                 time.sleep(2)  # Wait for Arduino to reset
                 print(f"Connected to Arduino on {arduino_port}")
+                self.arduino_reader = threading.Thread(
+                    target=self.read_arduino_responses, daemon=True
+                )
+                self.arduino_reader.start()
             except Exception as e:
                 print(f"Warning: Could not connect to Arduino: {e}")
                 print("Continuing without Arduino...")
@@ -40,146 +249,289 @@ class EyeTracker:
         
         # Timer for looking away detection
         self.look_away_start_time = None
-        self.look_away_threshold = 0.5  # 0.5 seconds
+        self.look_away_threshold = 0.5  # 0.5 seconds, also sets _threshold_ns
         self.signal_sent = False
         
-    def get_eye_center(self, landmarks, eye_indices, img_w, img_h):
-        """Calculate the center point of eye landmarks"""
-        x_coords = [landmarks[idx].x * img_w for idx in eye_indices]
-        y_coords = [landmarks[idx].y * img_h for idx in eye_indices]
-        return (int(np.mean(x_coords)), int(np.mean(y_coords)))
+    def _update_gaze_thr(self):
+        # Float so fractional thresholds compare the same as in the Numba kernel
+        self._gaze_thr = np.array([self._hthr, self._vthr] * 2, dtype=np.float64)
     
-    def get_iris_position(self, landmarks, iris_indices, img_w, img_h):
-        """Get iris center position"""
-        x_coords = [landmarks[idx].x * img_w for idx in iris_indices]
-        y_coords = [landmarks[idx].y * img_h for idx in iris_indices]
-        return (int(np.mean(x_coords)), int(np.mean(y_coords)))
+    @property
+    def horizontal_threshold(self):
+        return self._hthr
     
-    def calculate_gaze_ratio(self, eye_center, iris_center):
-        """Calculate the ratio of iris offset from eye center"""
-        dx = iris_center[0] - eye_center[0]
-        dy = iris_center[1] - eye_center[1]
-        return dx, dy
+    @horizontal_threshold.setter
+    def horizontal_threshold(self, value):
+        self._hthr = value
+        self._update_gaze_thr()
     
-    def is_looking_at_screen(self, left_eye_center, right_eye_center, 
-                            left_iris, right_iris, frame_shape):
-        """Check if user is looking at screen based on iris-to-eye-center distance"""
-        left_dx, left_dy = self.calculate_gaze_ratio(left_eye_center, left_iris)
-        right_dx, right_dy = self.calculate_gaze_ratio(right_eye_center, right_iris)
+    @property
+    def vertical_threshold(self):
+        return self._vthr
+    
+    @vertical_threshold.setter
+    def vertical_threshold(self, value):
+        self._vthr = value
+        self._update_gaze_thr()
+    
+    @property
+    def look_away_threshold(self):
+        return self._look_away_threshold
+    
+    @look_away_threshold.setter
+    def look_away_threshold(self, value):
+        self._look_away_threshold = value
+        self._threshold_ns = int(value * 1e9)
+    
+    def landmarks_to_array(self, landmarks):
+        """Copy normalized landmark x/y values into an (N, 2) float32 array.
+        Called once per frame so each landmark proto is only read once"""
+        return np.array([(lm.x, lm.y) for lm in landmarks], dtype=np.float32)
+    
+    def _centers(self, pts, idx, wh):
+        """Mean pixel position of the landmarks at idx"""
+        return (pts[idx].mean(axis=0) * wh).astype(np.int32)
+    
+    def get_centers(self, pts, img_w, img_h):
+        """Get left/right eye centers and left/right iris centers"""
+        wh = np.array([img_w, img_h], dtype=np.float32)
+        centers = self._centers
+        return tuple(
+            tuple(int(v) for v in centers(pts, idx, wh))
+            for idx in (self._LEFT_EYE_IDX, self._RIGHT_EYE_IDX,
+                        self._LEFT_IRIS_IDX, self._RIGHT_IRIS_IDX)
+        )
+    
+    def estimate_iris(self, frame, pts, eye_idx, wh):
+        """Estimate the iris center as the centroid of the darkest pixels inside
+        the eye outline's bounding box, for use without iris landmarks"""
+        eye = pts[eye_idx] * wh
+        x1, y1 = np.floor(eye.min(axis=0)).astype(np.int32)
+        x2, y2 = np.ceil(eye.max(axis=0)).astype(np.int32)
+        center = (int((x1 + x2) // 2), int((y1 + y2) // 2))
+        # Landmarks can fall outside the frame when the face is partly out of view
+        frame_h, frame_w = frame.shape[:2]
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, frame_w), min(y2, frame_h)
+        if x2 - x1 < 3 or y2 - y1 < 3:
+            return center
         
-        # Thresholds for "looking at screen"
-        horizontal_threshold = 4  # pixels
-        vertical_threshold = 2    # pixels
+        gray = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+        gray = cv2.GaussianBlur(gray, (3, 3), 0)
+        # The pupil/iris is the darkest part of the eye region
+        mask = (gray <= np.percentile(gray, 20)).astype(np.uint8)
+        m = cv2.moments(mask, binaryImage=True)
+        if m['m00'] == 0:
+            return center
+        return (x1 + int(m['m10'] / m['m00']), y1 + int(m['m01'] / m['m00']))
+    
+    def get_gaze(self, pts, img_w, img_h, frame):
+        """Get eye/iris centers and whether the user is looking at the screen,
+        using the compiled kernel when Numba is installed"""
+        if not self.high_precision:
+            wh = np.array([img_w, img_h], dtype=np.float32)
+            left_eye_center = tuple(int(v) for v in self._centers(pts, self._LEFT_EYE_IDX, wh))
+            right_eye_center = tuple(int(v) for v in self._centers(pts, self._RIGHT_EYE_IDX, wh))
+            left_iris = self.estimate_iris(frame, pts, self._LEFT_EYE_IDX, wh)
+            right_iris = self.estimate_iris(frame, pts, self._RIGHT_EYE_IDX, wh)
+            centers = (left_eye_center, right_eye_center, left_iris, right_iris)
+            return centers, self.is_looking_at_screen(*centers, frame.shape)
         
-        # Check if iris is relatively centered in both eyes
-        left_centered = (abs(left_dx) < horizontal_threshold and 
-                        abs(left_dy) < vertical_threshold)   
-        right_centered = (abs(right_dx) < horizontal_threshold and 
-                         abs(right_dy) < vertical_threshold)
+        if _gaze_kernel is not None:
+            lex, ley, rex, rey, lix, liy, rix, riy, looking = _gaze_kernel(
+                pts, self._LEFT_EYE_IDX, self._RIGHT_EYE_IDX,
+                self._LEFT_IRIS_IDX, self._RIGHT_IRIS_IDX,
+                img_w, img_h, self._hthr, self._vthr
+            )
+            return ((lex, ley), (rex, rey), (lix, liy), (rix, riy)), looking
         
-        return left_centered and right_centered
+        centers = self.get_centers(pts, img_w, img_h)
+        return centers, self.is_looking_at_screen(*centers, (img_h, img_w))
+    
+    def eye_aspect_ratio(self, pts, idx, wh):
+        """Eye aspect ratio (EAR) of the six outline landmarks at idx"""
+        p = pts[idx] * wh
+        vertical = np.linalg.norm(p[1] - p[5]) + np.linalg.norm(p[2] - p[4])
+        horizontal = np.linalg.norm(p[0] - p[3])
+        return vertical / (2.0 * horizontal) if horizontal > 0 else 0.0
+    
+    def is_blinking(self, pts, img_w, img_h, now):
+        """Check for a blink and update the open-eye EAR baseline"""
+        wh = np.array([img_w, img_h], dtype=np.float32)
+        eye_aspect_ratio = self.eye_aspect_ratio
+        ear = (eye_aspect_ratio(pts, self._LEFT_EYE_IDX, wh) +
+               eye_aspect_ratio(pts, self._RIGHT_EYE_IDX, wh)) / 2.0
+        
+        baseline = self.ear_baseline
+        if baseline is not None and ear < baseline * self.blink_ratio:
+            if self._blink_start is None:
+                self._blink_start = now
+            return now - self._blink_start < self.max_blink_ns
+        self._blink_start = None
+        
+        # Track the open-eye EAR so the threshold adapts to the user
+        self.ear_baseline = ear if baseline is None else 0.9 * baseline + 0.1 * ear
+        return False
+    
+    def is_looking_at_screen(self, left_eye_center, right_eye_center, 
+                            left_iris, right_iris, frame_shape):
+        """Check if user is looking at screen based on iris-to-eye-center distance"""
+        # Iris offsets (left dx, left dy, right dx, right dy) checked in one compare
+        d = np.subtract((left_iris, right_iris),
+                        (left_eye_center, right_eye_center), dtype=np.int32).ravel()
+        return bool((np.abs(d) < self._gaze_thr).all())
+    
+    def _log(self, msg):
+        """Write an event message without flushing, run() flushes on exit"""
+        sys.stdout.write(msg + "\n")
     
     def send_arduino_signal(self):
         """Send trigger signal to Arduino"""
         if self.use_arduino and self.arduino:
             try:
-                self.arduino.write(b'1')
-                print("Signal sent to Arduino!")
-                
-                # Read Arduino response
-                time.sleep(0.1)
-                while self.arduino.in_waiting > 0:
-                    response = self.arduino.readline().decode('utf-8').strip()
-                    print(f"Arduino: {response}")
-                    
+                self.arduino.write(self._trigger_pkt)
+                self._log("Signal sent to Arduino!")
             except Exception as e:
                 print(f"Error sending signal to Arduino: {e}")
     
+    def read_arduino_responses(self):
+        """Collect Arduino responses in the background so sends never wait on them"""
+        while self.use_arduino and self.arduino and self.arduino.is_open:
+            try:
+                line = self.arduino.readline()
+            except Exception:
+                break
+            if line:
+                response = line.decode('utf-8', errors='replace').strip()
+                self.arduino_responses.append(response)
+                self._log(f"Arduino: {response}")
+    
+    def _update_look_away(self, now, looking, reason, announce_start=True):
+        """Advance the look-away timer (perf_counter_ns) and fire the Arduino once
+        the threshold passes. Returns nanoseconds spent looking away"""
+        if looking:
+            # Reset timer when looking at screen
+            self.look_away_start_time = None
+            self.signal_sent = False
+            return 0
+        
+        # Start timer if just looked away
+        start = self.look_away_start_time
+        if start is None:
+            start = self.look_away_start_time = now
+            self.signal_sent = False
+            if announce_start:
+                self._log("Started looking away...")
+        
+        elapsed_ns = now - start
+        if elapsed_ns >= self._threshold_ns and not self.signal_sent:
+            self._log(f"{reason} for {self.look_away_threshold} seconds!")
+            self.send_arduino_signal()
+            self.signal_sent = True
+        return elapsed_ns
+    
+    def draw_annotations(self, frame):
+        """Draw the most recent eye positions and status onto frame"""
+        if not self.draw:
+            return frame
+        
+        centers = self.last_centers
+        if centers is not None:
+            left_eye_center, right_eye_center, left_iris, right_iris = centers
+            circle = cv2.circle
+            line = cv2.line
+            
+            # Draw eye regions
+            circle(frame, left_eye_center, 8, (0, 255, 255), 2)
+            circle(frame, right_eye_center, 8, (0, 255, 255), 2)
+            
+            # Draw iris positions
+            circle(frame, left_iris, 5, (255, 0, 0), -1)
+            circle(frame, right_iris, 5, (255, 0, 0), -1)
+            
+            # Draw lines from eye center to iris
+            line(frame, left_eye_center, left_iris, (0, 255, 0), 2)
+            line(frame, right_eye_center, right_iris, (0, 255, 0), 2)
+        
+        cv2.putText(frame, self.last_status, (10, 30), 
+                   self._font, 1, self.last_color, 2)
+        return frame
+    
     def process_frame(self, frame):
         """Process a single frame and detect eye position"""
         img_h, img_w = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+        rgb_buf = self._rgb_buf
+        if rgb_buf.shape != frame.shape:
+            rgb_buf = self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        
+        inference_size = self.inference_size
+        downscaled = inference_size is not None and self._full_res_frames == 0
+        if downscaled:
+            small_buf = self._small_buf
+            cv2.resize(rgb_buf, inference_size, dst=small_buf,
+                       interpolation=cv2.INTER_AREA)
+            results = self.face_mesh.process(small_buf)
+        if not downscaled or not results.multi_face_landmarks:
+            results = self.face_mesh.process(rgb_buf)
+            if inference_size is not None:
+                # A low-res miss starts a full-res hold, otherwise count it down
+                self._full_res_frames = (self.full_res_hold if downscaled
+                                         else self._full_res_frames - 1)
         
-        current_time = time.time()
+        now = time.perf_counter_ns()
         
         if results.multi_face_landmarks:
             face_landmarks = results.multi_face_landmarks[0]
             landmarks = face_landmarks.landmark
             
-            # Get eye centers
-            left_eye_center = self.get_eye_center(landmarks, self.LEFT_EYE, img_w, img_h)
-            right_eye_center = self.get_eye_center(landmarks, self.RIGHT_EYE, img_w, img_h)
-            
-            # Get iris positions
-            left_iris = self.get_iris_position(landmarks, self.LEFT_IRIS, img_w, img_h)
-            right_iris = self.get_iris_position(landmarks, self.RIGHT_IRIS, img_w, img_h)
+            pts = self.landmarks_to_array(landmarks)
             
-            # Draw eye regions
-            cv2.circle(frame, left_eye_center, 8, (0, 255, 255), 2)
-            cv2.circle(frame, right_eye_center, 8, (0, 255, 255), 2)
-            
-            # Draw iris positions
-            cv2.circle(frame, left_iris, 5, (255, 0, 0), -1)
-            cv2.circle(frame, right_iris, 5, (255, 0, 0), -1)
+            # Iris position is meaningless mid-blink, so keep the previous
+            # decision and annotations and leave the look-away timer alone
+            if self.is_blinking(pts, img_w, img_h, now):
+                self.last_status = "Blinking"
+                self.last_color = (0, 255, 255)
+                return self.draw_annotations(frame), self.looking_at_screen
             
-            # Draw lines from eye center to iris
-            cv2.line(frame, left_eye_center, left_iris, (0, 255, 0), 2)
-            cv2.line(frame, right_eye_center, right_iris, (0, 255, 0), 2)
+            # Get eye centers, iris positions and the gaze decision
+            self.last_centers, looking = self.get_gaze(pts, img_w, img_h, frame)
             
-            # Check if looking at screen
-            self.looking_at_screen = self.is_looking_at_screen(
-                left_eye_center, right_eye_center, 
-                left_iris, right_iris, 
-                frame.shape
-            )
+            self.looking_at_screen = looking
+            elapsed_ns = self._update_look_away(now, looking, "Looked away")
             
-            # Handle looking away timer
-            if not self.looking_at_screen:
-                # Start timer if just looked away
-                if self.look_away_start_time is None:
-                    self.look_away_start_time = current_time
-                    self.signal_sent = False
-                    print("Started looking away...")
-                
-                # Check if looked away for 2 seconds
-                elapsed_time = current_time - self.look_away_start_time
-                
-                if elapsed_time >= self.look_away_threshold and not self.signal_sent:
-                    print(f"Looked away for {self.look_away_threshold} seconds!")
-                    self.send_arduino_signal()
-                    self.signal_sent = True
-                
-                # Display timer
-                status = f"Not looking: {elapsed_time:.1f}s"
-                color = (0, 0, 255)
-                
+            if looking:
+                self.last_status = "Looking at screen"
+                self.last_color = (0, 255, 0)
             else:
-                # Reset timer when looking at screen
-                self.look_away_start_time = None
-                self.signal_sent = False
-                status = "Looking at screen"
-                color = (0, 255, 0)
-            
-            cv2.putText(frame, status, (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+                self.last_status = f"Not looking: {elapsed_ns / 1e9:.1f}s"
+                self.last_color = (0, 0, 255)
             
-            return frame, self.looking_at_screen
+            return self.draw_annotations(frame), looking
         
         # No face detected - treat as looking away
-        if self.look_away_start_time is None:
-            self.look_away_start_time = current_time
-            self.signal_sent = False
+        self.last_centers = None
+        elapsed_ns = self._update_look_away(now, False, "No face detected",
+                                            announce_start=False)
         
-        elapsed_time = current_time - self.look_away_start_time
-        if elapsed_time >= self.look_away_threshold and not self.signal_sent:
-            print(f"No face detected for {self.look_away_threshold} seconds!")
-            self.send_arduino_signal()
-            self.signal_sent = True
+        self.last_status = f"No face: {elapsed_ns / 1e9:.1f}s"
+        self.last_color = (0, 0, 255)
+        return self.draw_annotations(frame), False
+    
+    def warm_up(self):
+        """Run a blank frame through the face mesh, and dummy landmarks through
+        the Numba kernel, so model initialization and JIT compilation happen
+        before the first real frame"""
+        width, height = self.inference_size or (640, 480)
+        self.face_mesh.process(np.zeros((height, width, 3), dtype=np.uint8))
         
-        cv2.putText(frame, f"No face: {elapsed_time:.1f}s", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-        return frame, False
+        if _gaze_kernel is not None:
+            _gaze_kernel(
+                np.zeros((478, 2), dtype=np.float32),
+                self._LEFT_EYE_IDX, self._RIGHT_EYE_IDX,
+                self._LEFT_IRIS_IDX, self._RIGHT_IRIS_IDX,
+                640, 480, self._hthr, self._vthr
+            )
     
     def run(self, camera_index=1):
         """Main loop to run the eye tracker"""
@@ -205,41 +557,62 @@ class EyeTracker:
         # Set camera properties
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep the driver queue short
         
-        # Give camera time to warm up
+        # Give camera time to warm up, initializing the face mesh meanwhile
+        warm_up_thread = threading.Thread(target=self.warm_up, daemon=True)
+        warm_up_thread.start()
         time.sleep(1)
+        warm_up_thread.join()
         
         print("Eye Tracker started. Press 'q' to quit.")
         print(f"Camera opened successfully at index {camera_index}")
         if self.use_arduino:
             print("Arduino signal will be sent after 2 seconds of looking away")
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Error: Could not read frame")
-                break
-            
-            # Flip frame horizontally for mirror view
-            frame = cv2.flip(frame, 1)
-            
-            # Process the frame
-            processed_frame, looking = self.process_frame(frame)
+        grabber = FrameGrabber(cap).start()
+        frame_count = 0
+        
+        try:
+            while True:
+                frame = grabber.get_latest()
+                if frame is None:
+                    print("Error: Could not read frame")
+                    break
+                
+                # Flip frame horizontally for mirror view
+                frame = cv2.flip(frame, 1)
+                
+                # Process every frame_skip-th frame, redraw the last result otherwise
+                if frame_count % self.frame_skip == 0:
+                    processed_frame, looking = self.process_frame(frame)
+                else:
+                    processed_frame = self.draw_annotations(frame)
+                frame_count += 1
+                
+                # Display the frame
+                cv2.imshow('Eye Tracker', processed_frame)
+                
+                # Exit on 'q' key
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+        finally:
+            if grabber.stop():
+                cap.release()
+            else:
+                print("Warning: camera read is stalled, leaving capture open")
+            cv2.destroyAllWindows()
+            self.face_mesh.close()
             
-            # Display the frame
-            cv2.imshow('Eye Tracker', processed_frame)
+            # Close Arduino connection
+            if self.arduino:
+                self.use_arduino = False
+                if self.arduino_reader:
+                    self.arduino_reader.join(timeout=1.0)
+                self.arduino.close()
+                print("Arduino connection closed")
             
-            # Exit on 'q' key
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
-        
-        cap.release()
-        cv2.destroyAllWindows()
-        
-        # Close Arduino connection
-        if self.arduino:
-            self.arduino.close()
-            print("Arduino connection closed")
+            sys.stdout.flush()
 
 if __name__ == "__main__":
     # Create and run the eye tracker